@@ -1,5 +1,7 @@
 """Audio recording functionality for radio synopsis application."""
 
+import platform
+import re
 import subprocess
 import threading
 import time
@@ -12,6 +14,12 @@ from database import db
 
 logger = logging.getLogger(__name__)
 
+# Session ID embedded in the station settings response
+_SESSION_ID_PATTERN = re.compile(r"playSessionID=([A-F0-9\-]{32,})")
+
+# Drops apostrophes and turns spaces into underscores for filenames
+_FILENAME_TABLE = str.maketrans({"'": None, " ": "_"})
+
 class AudioRecorder:
     """Handles audio recording from radio stream or local input."""
     
@@ -31,7 +39,7 @@ class AudioRecorder:
         # Generate filename with program identifier
         date_str = start_time.strftime('%Y-%m-%d')
         # Sanitize program name for filename
-        prog_short = program_name.replace("'", "").replace(" ", "_").lower()
+        prog_short = program_name.translate(_FILENAME_TABLE).lower()
         audio_filename = f"{date_str}_{prog_short}_block_{block_code}.wav"
         audio_path = Config.AUDIO_DIR / audio_filename
         
@@ -104,8 +112,6 @@ class AudioRecorder:
         
         try:
             import requests
-            import time
-            import re
             
             # Check if we need to use dynamic session ID
             if "playSessionID=DYNAMIC" in url:
@@ -128,7 +134,7 @@ class AudioRecorder:
                 settings_response.raise_for_status()
                 
                 # Extract session ID from settings using improved pattern
-                session_match = re.search(r"playSessionID=([A-F0-9\-]{32,})", settings_response.text)
+                session_match = _SESSION_ID_PATTERN.search(settings_response.text)
                 if not session_match:
                     logger.warning("Could not extract session ID from station settings, trying direct stream...")
                     # Fallback to direct stream without session ID (discovered working method)
@@ -253,7 +259,6 @@ class AudioRecorder:
         """Record from system audio input using ffmpeg."""
         
         # Platform-specific audio input
-        import platform
         system = platform.system().lower()
         
         if system == 'windows':
@@ -104,9 +104,13 @@ class Config:
     # Maps to VOB Brass Tacks blocks
     BLOCKS = PROGRAMS['VOB_BRASS_TACKS']['blocks']
     
+    # Flattened block map, built on first use by get_all_blocks()
+    _all_blocks = None
+    
     # Processing Configuration
     MAX_SUMMARY_LENGTH = int(os.getenv('MAX_SUMMARY_LENGTH', 1000))
     ENABLE_DETAILED_QUOTES = os.getenv('ENABLE_DETAILED_QUOTES', 'true').lower() == 'true'
+    TRANSCRIPTION_CONCURRENCY = max(1, int(os.getenv('TRANSCRIPTION_CONCURRENCY', 4)))
     
     @classmethod
     def validate(cls):
@@ -148,24 +152,31 @@ class Config:
     @classmethod
     def get_program_by_block(cls, block_code: str):
         """Get program key and config for a given block code."""
-        for prog_key, prog_config in cls.PROGRAMS.items():
-            if block_code in prog_config['blocks']:
-                return prog_key, prog_config
-        return None, None
+        block_info = cls.get_all_blocks().get(block_code)
+        if block_info is None:
+            return None, None
+        prog_key = block_info['program_key']
+        return prog_key, cls.PROGRAMS[prog_key]
     
     @classmethod
     def get_all_blocks(cls):
-        """Get all blocks across all programs."""
-        all_blocks = {}
-        for prog_key, prog_config in cls.PROGRAMS.items():
-            for block_code, block_info in prog_config['blocks'].items():
-                all_blocks[block_code] = {
-                    **block_info,
-                    'program_key': prog_key,
-                    'program_name': prog_config['name'],
-                    'station': prog_config['station']
-                }
-        return all_blocks
+        """Get all blocks across all programs.
+        
+        PROGRAMS is fixed at import time, so the map is built once and shared;
+        callers must treat it as read-only.
+        """
+        if cls._all_blocks is None:
+            all_blocks = {}
+            for prog_key, prog_config in cls.PROGRAMS.items():
+                for block_code, block_info in prog_config['blocks'].items():
+                    all_blocks[block_code] = {
+                        **block_info,
+                        'program_key': prog_key,
+                        'program_name': prog_config['name'],
+                        'station': prog_config['station']
+                    }
+            cls._all_blocks = all_blocks
+        return cls._all_blocks
 
 # Validate configuration on import
 Config.validate()
@@ -1,6 +1,8 @@
 """Database models and operations for the radio synopsis application."""
 
+import os
 import sqlite3
+import threading
 from datetime import datetime, date
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -12,12 +14,19 @@ class Database:
     
     def __init__(self, db_path: Path = Config.DB_PATH):
         self.db_path = db_path
+        # One persistent connection per thread (sqlite3 connections are thread-bound)
+        self._local = threading.local()
         self.init_database()
     
     def get_connection(self):
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        # Reconnect in forked worker processes rather than sharing the parent's handle
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row  # Enable dict-like access
+            self._local.conn = conn
+            self._local.pid = os.getpid()
         return conn
     
     def init_database(self):
@@ -149,6 +158,54 @@ class Database:
             ).fetchone()
             return dict(row) if row else None
     
+    def get_block_with_summary(self, block_id: int) -> Optional[Dict]:
+        """Get block by ID with its summary (or None) under the 'summary' key."""
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT b.*,
+                       s.id AS s_id, s.block_id AS s_block_id, s.summary_text AS s_summary_text,
+                       s.key_points AS s_key_points, s.entities AS s_entities,
+                       s.caller_count AS s_caller_count, s.quotes AS s_quotes,
+                       s.created_at AS s_created_at
+                FROM blocks b
+                LEFT JOIN summaries s ON s.id = (
+                    SELECT MIN(id) FROM summaries WHERE block_id = b.id
+                )
+                WHERE b.id = ?
+            """, (block_id,)).fetchone()
+        
+        if not row:
+            return None
+        
+        block = {}
+        summary = {}
+        for key in row.keys():
+            if key.startswith('s_'):
+                summary[key[2:]] = row[key]
+            else:
+                block[key] = row[key]
+        
+        if summary['id'] is None:
+            block['summary'] = None
+        else:
+            # Parse JSON fields
+            summary['key_points'] = json.loads(summary['key_points'])
+            summary['entities'] = json.loads(summary['entities'])
+            summary['quotes'] = json.loads(summary['quotes'])
+            block['summary'] = summary
+        return block
+    
+    def get_dates_with_blocks(self, start_date: date, end_date: date) -> List[date]:
+        """Get dates in an inclusive range that have at least one block, newest first."""
+        with self.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT DISTINCT s.show_date FROM shows s
+                JOIN blocks b ON b.show_id = s.id
+                WHERE s.show_date BETWEEN ? AND ?
+                ORDER BY s.show_date DESC
+            """, (start_date, end_date)).fetchall()
+            return [date.fromisoformat(row['show_date']) for row in rows]
+    
     def get_blocks_by_date(self, show_date: date, program_name: str = None) -> List[Dict]:
         """Get all blocks for a specific date, optionally filtered by program."""
         with self.get_connection() as conn:
@@ -201,6 +258,31 @@ class Database:
                 return summary
             return None
     
+    def get_summaries_by_block_ids(self, block_ids: List[int]) -> Dict[int, Dict]:
+        """Get summaries for several blocks in one query, keyed by block ID."""
+        if not block_ids:
+            return {}
+        
+        placeholders = ', '.join('?' for _ in block_ids)
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM summaries WHERE block_id IN ({placeholders}) ORDER BY id",
+                list(block_ids)
+            ).fetchall()
+        
+        summaries = {}
+        for row in rows:
+            # Keep the first summary per block, matching get_summary()
+            if row['block_id'] in summaries:
+                continue
+            summary = dict(row)
+            # Parse JSON fields
+            summary['key_points'] = json.loads(summary['key_points'])
+            summary['entities'] = json.loads(summary['entities'])
+            summary['quotes'] = json.loads(summary['quotes'])
+            summaries[summary['block_id']] = summary
+        return summaries
+    
     def create_daily_digest(self, show_date: date, digest_text: str, total_blocks: int, 
                            total_callers: int, programs_included: List[str] = None) -> int:
         """Create daily digest."""
@@ -2,8 +2,10 @@
 
 import argparse
 import sys
+import threading
+import time
 import logging
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 
 from config import Config
@@ -84,7 +86,6 @@ def run_scheduler():
         logger.info("Scheduler started successfully")
         
         # Keep running
-        import time
         while scheduler.running:
             time.sleep(60)
             
@@ -98,6 +99,19 @@ def run_web_server():
     logger.info("Starting web server...")
     start_web_server()
 
+def _parse_date_arg(show_date: str = None):
+    """Parse a YYYY-MM-DD command-line date, defaulting to today.
+    
+    Returns None (after logging) when the value is malformed.
+    """
+    if not show_date:
+        return date.today()
+    try:
+        return datetime.strptime(show_date, '%Y-%m-%d').date()
+    except ValueError:
+        logger.error(f"Invalid date format: {show_date}. Use YYYY-MM-DD")
+        return None
+
 def run_manual_recording(block_code: str):
     """Run manual recording for a specific block."""
     # Find which program this block belongs to
@@ -126,15 +140,9 @@ def run_manual_processing(block_code: str, show_date: str = None):
         logger.error(f"Invalid block code: {block_code}")
         return False
     
-    if show_date:
-        try:
-            from datetime import datetime
-            parsed_date = datetime.strptime(show_date, '%Y-%m-%d').date()
-        except ValueError:
-            logger.error(f"Invalid date format: {show_date}. Use YYYY-MM-DD")
-            return False
-    else:
-        parsed_date = date.today()
+    parsed_date = _parse_date_arg(show_date)
+    if parsed_date is None:
+        return False
     
     logger.info(f"Starting manual processing for Block {block_code} ({program_config['name']}) on {parsed_date}")
     success = scheduler.run_manual_processing(block_code, parsed_date, program_key)
@@ -148,15 +156,9 @@ def run_manual_processing(block_code: str, show_date: str = None):
 
 def create_daily_digest(show_date: str = None):
     """Create daily digest for a specific date."""
-    if show_date:
-        try:
-            from datetime import datetime
-            parsed_date = datetime.strptime(show_date, '%Y-%m-%d').date()
-        except ValueError:
-            logger.error(f"Invalid date format: {show_date}. Use YYYY-MM-DD")
-            return False
-    else:
-        parsed_date = date.today()
+    parsed_date = _parse_date_arg(show_date)
+    if parsed_date is None:
+        return False
     
     logger.info(f"Creating daily digest for {parsed_date}")
     digest = summarizer.create_daily_digest(parsed_date)
@@ -251,9 +253,6 @@ def main():
         sys.exit(0 if success else 1)
     
     elif args.command == 'run':
-        import threading
-        import time
-        
         # Start scheduler in background
         scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         scheduler_thread.start()
@@ -284,8 +284,8 @@ class RadioScheduler:
         # Try to parse date from filename (YYYY-MM-DD format)
         try:
             date_str = filename.split('_')[0]
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
-        except:
+            return date.fromisoformat(date_str)
+        except ValueError:
             # Fallback to modification time
             return date.fromtimestamp(file_path.stat().st_mtime)
     
@@ -3,6 +3,7 @@
 import openai
 import logging
 import json
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -13,6 +14,61 @@ from database import db
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Section headings recognised in GPT summary responses (matched on lowercased lines)
+_KEY_POINTS_SECTION = re.compile(r'key topics|summary|issues|concerns')
+_ENTITIES_SECTION = re.compile(r'entities|mentioned|people|organizations')
+_QUOTES_SECTION = re.compile(r'quotes|notable')
+
+# Quoted passages of 20-100 characters in a summary response
+_QUOTE_PATTERN = re.compile(r'"([^"]{20,100})"')
+
+# Block-specific summary instructions, keyed by block code
+_BLOCK_INSTRUCTIONS = {
+    # Morning Block (10:00-12:00)
+    'A': """
+1. EXECUTIVE SUMMARY (2-3 sentences)
+2. KEY TOPICS DISCUSSED (bullet points)
+3. PUBLIC CONCERNS RAISED (by callers)
+4. POLICY IMPLICATIONS (if any)
+5. NOTABLE QUOTES (1-2 most significant)
+6. ENTITIES MENTIONED (people, organizations, places)
+
+Focus on: Major topics, recurring themes, government-related discussions, community issues.
+""",
+    # News Summary Block (12:05-12:30)
+    'B': """
+1. NEWS SUMMARY (key headlines covered)
+2. GOVERNMENT ANNOUNCEMENTS (if any)
+3. PUBLIC REACTION (caller responses)
+4. NOTABLE QUOTES (1-2 most relevant)
+5. ENTITIES MENTIONED (officials, ministries, organizations)
+
+Focus on: Official announcements, policy updates, public reactions to news.
+""",
+    # Major Newscast Block (12:40-13:30)
+    'C': """
+1. MAJOR NEWS ITEMS (prioritized list)
+2. GOVERNMENT/POLITICAL CONTENT
+3. COMMUNITY ISSUES HIGHLIGHTED
+4. CALLER CONTRIBUTIONS (concerns, questions)
+5. NOTABLE QUOTES (1-2 most impactful)
+6. ENTITIES MENTIONED (key figures, organizations)
+
+Focus on: Breaking news, political developments, community concerns, official statements.
+""",
+    # History Block (13:35-14:00)
+    'D': """
+1. HISTORICAL TOPIC COVERED
+2. RELEVANCE TO CURRENT ISSUES (if any)
+3. EDUCATIONAL CONTENT SUMMARY
+4. CALLER ENGAGEMENT (questions, comments)
+5. NOTABLE QUOTES (1-2 educational highlights)
+6. ENTITIES MENTIONED (historical figures, places, events)
+
+Focus on: Historical context, educational value, connections to contemporary issues.
+""",
+}
+
 class RadioSummarizer:
     """Generates summaries for radio transcripts using OpenAI GPT."""
     
@@ -98,14 +154,15 @@ class RadioSummarizer:
         if not transcript_text.strip():
             logger.warning("Empty transcript text")
             # Handle empty/silence transcript gracefully
-            summary_data = self._create_empty_summary(block_code, block_name, transcript_data)
+            now = datetime.now()
+            summary_data = self._create_empty_summary(block_code, block_name, transcript_data, now)
             
             # Save summary
             audio_file = block.get('audio_file_path', 'unknown')
             if audio_file and audio_file != 'unknown':
                 summary_filename = f"{Path(audio_file).stem}_summary.json"
             else:
-                summary_filename = f"block_{block_code}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_summary.json"
+                summary_filename = f"block_{block_code}_{now.strftime('%Y%m%d_%H%M%S')}_summary.json"
             summary_path = Config.SUMMARIES_DIR / summary_filename
             
             with open(summary_path, 'w', encoding='utf-8') as f:
@@ -174,49 +231,8 @@ Transcript:
 Please provide a structured summary for government civil servants including:
 """
         
-        if block_code == 'A':  # Morning Block (10:00-12:00)
-            specific_instructions = """
-1. EXECUTIVE SUMMARY (2-3 sentences)
-2. KEY TOPICS DISCUSSED (bullet points)
-3. PUBLIC CONCERNS RAISED (by callers)
-4. POLICY IMPLICATIONS (if any)
-5. NOTABLE QUOTES (1-2 most significant)
-6. ENTITIES MENTIONED (people, organizations, places)
-
-Focus on: Major topics, recurring themes, government-related discussions, community issues.
-"""
-        elif block_code == 'B':  # News Summary Block (12:05-12:30)
-            specific_instructions = """
-1. NEWS SUMMARY (key headlines covered)
-2. GOVERNMENT ANNOUNCEMENTS (if any)
-3. PUBLIC REACTION (caller responses)
-4. NOTABLE QUOTES (1-2 most relevant)
-5. ENTITIES MENTIONED (officials, ministries, organizations)
-
-Focus on: Official announcements, policy updates, public reactions to news.
-"""
-        elif block_code == 'C':  # Major Newscast Block (12:40-13:30)
-            specific_instructions = """
-1. MAJOR NEWS ITEMS (prioritized list)
-2. GOVERNMENT/POLITICAL CONTENT
-3. COMMUNITY ISSUES HIGHLIGHTED
-4. CALLER CONTRIBUTIONS (concerns, questions)
-5. NOTABLE QUOTES (1-2 most impactful)
-6. ENTITIES MENTIONED (key figures, organizations)
-
-Focus on: Breaking news, political developments, community concerns, official statements.
-"""
-        else:  # Block D - History Block (13:35-14:00)
-            specific_instructions = """
-1. HISTORICAL TOPIC COVERED
-2. RELEVANCE TO CURRENT ISSUES (if any)
-3. EDUCATIONAL CONTENT SUMMARY
-4. CALLER ENGAGEMENT (questions, comments)
-5. NOTABLE QUOTES (1-2 educational highlights)
-6. ENTITIES MENTIONED (historical figures, places, events)
-
-Focus on: Historical context, educational value, connections to contemporary issues.
-"""
+        # Block D - History Block instructions double as the fallback
+        specific_instructions = _BLOCK_INSTRUCTIONS.get(block_code, _BLOCK_INSTRUCTIONS['D'])
         
         return base_context + specific_instructions + """
 
@@ -224,9 +240,13 @@ Format your response clearly with numbered sections. Keep summaries concise but
 Maintain objectivity and focus on factual content relevant to government decision-making.
 """
     
-    def _create_empty_summary(self, block_code: str, block_name: str, transcript_data: Dict) -> Dict:
+    def _create_empty_summary(self, block_code: str, block_name: str, transcript_data: Dict,
+                              generated_at: Optional[datetime] = None) -> Dict:
         """Create a summary for empty/silence recordings."""
         
+        if generated_at is None:
+            generated_at = datetime.now()
+        
         return {
             'block_code': block_code,
             'block_name': block_name,
@@ -237,7 +257,7 @@ Maintain objectivity and focus on factual content relevant to government decisio
             'entities_mentioned': [],
             'policy_implications': 'None - no content available',
             'is_silence': True,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at.isoformat(),
             'transcript_stats': {
                 'word_count': 0,
                 'duration': 0,
@@ -253,24 +273,25 @@ Maintain objectivity and focus on factual content relevant to government decisio
         entities = []
         quotes = []
         
-        lines = summary_text.split('\n')
         current_section = None
         
-        for line in lines:
+        for line in summary_text.splitlines():
             line = line.strip()
             if not line:
                 continue
             
             # Identify sections
-            if any(keyword in line.lower() for keyword in ['key topics', 'summary', 'issues', 'concerns']):
+            line_lower = line.lower()
+            if _KEY_POINTS_SECTION.search(line_lower):
                 current_section = 'key_points'
-            elif any(keyword in line.lower() for keyword in ['entities', 'mentioned', 'people', 'organizations']):
+            elif _ENTITIES_SECTION.search(line_lower):
                 current_section = 'entities'
-            elif any(keyword in line.lower() for keyword in ['quotes', 'notable']):
+            elif _QUOTES_SECTION.search(line_lower):
                 current_section = 'quotes'
             
-            # Extract bullet points and numbered items
-            if line.startswith('•') or line.startswith('-') or (len(line) > 0 and line[0].isdigit() and '.' in line[:5]):
+            # Extract bullet points and numbered items, dispatching on the first character
+            first_char = line[0]
+            if first_char in '•-' or (first_char.isdigit() and '.' in line[:5]):
                 cleaned_line = line.lstrip('•-0123456789. ').strip()
                 if len(cleaned_line) > 10:  # Minimum length for meaningful content
                     if current_section == 'entities':
@@ -285,9 +306,7 @@ Maintain objectivity and focus on factual content relevant to government decisio
             quotes = existing_quotes[:3]  # Limit to top 3
         else:
             # Try to extract quotes from summary text
-            import re
-            quote_pattern = r'"([^"]{20,100})"'
-            found_quotes = re.findall(quote_pattern, summary_text)
+            found_quotes = _QUOTE_PATTERN.findall(summary_text)
             quotes = [{'text': q, 'speaker': 'Unknown', 'timestamp': '00:00'} for q in found_quotes[:2]]
         
         # Clean up entities (remove duplicates, common words)
@@ -306,7 +325,15 @@ Maintain objectivity and focus on factual content relevant to government decisio
         
         # Get all completed blocks for the date (across all programs)
         blocks = db.get_blocks_by_date(show_date)
-        completed_blocks = [b for b in blocks if b['status'] == 'completed']
+        
+        # Split completed/incomplete blocks in a single pass
+        completed_blocks = []
+        incomplete_blocks = []
+        for b in blocks:
+            if b['status'] == 'completed':
+                completed_blocks.append(b)
+            else:
+                incomplete_blocks.append(b['block_code'])
         
         # ✅ PREMATURE DIGEST FIX: Ensure ALL blocks across ALL programs are completed
         all_blocks_config = Config.get_all_blocks()
@@ -316,8 +343,7 @@ Maintain objectivity and focus on factual content relevant to government decisio
             logger.warning(f"⏳ Only {len(blocks)}/{expected_block_count} blocks exist for {show_date} - waiting for all blocks to be scheduled")
             return None
         
-        if len(completed_blocks) < len(blocks):
-            incomplete_blocks = [b['block_code'] for b in blocks if b['status'] != 'completed']
+        if incomplete_blocks:
             logger.warning(f"⏳ Only {len(completed_blocks)}/{len(blocks)} blocks completed for {show_date} - waiting for all blocks to finish")
             logger.info(f"  Incomplete blocks: {', '.join(incomplete_blocks)}")
             return None
@@ -332,16 +358,17 @@ Maintain objectivity and focus on factual content relevant to government decisio
         programs_data = {}
         total_callers = 0
         all_entities = set()
-        all_blocks = Config.get_all_blocks()
+        summaries = db.get_summaries_by_block_ids([b['id'] for b in completed_blocks])
         
         for block in completed_blocks:
-            summary = db.get_summary(block['id'])
+            summary = summaries.get(block['id'])
             if summary:
                 program_name = block.get('program_name', 'Down to Brass Tacks')
                 
                 # Initialize program data if needed
-                if program_name not in programs_data:
-                    programs_data[program_name] = {
+                prog_data = programs_data.get(program_name)
+                if prog_data is None:
+                    prog_data = programs_data[program_name] = {
                         'blocks': [],
                         'callers': 0,
                         'entities': set()
@@ -349,23 +376,25 @@ Maintain objectivity and focus on factual content relevant to government decisio
                 
                 # Get block info from config
                 block_code = block['block_code']
-                block_info = all_blocks.get(block_code, {})
+                block_info = all_blocks_config.get(block_code, {})
                 block_name = block_info.get('name', f'Block {block_code}')
+                caller_count = summary['caller_count']
+                entities = summary['entities']
                 
-                programs_data[program_name]['blocks'].append({
+                prog_data['blocks'].append({
                     'block_code': block_code,
                     'block_name': block_name,
                     'summary': summary['summary_text'],
                     'key_points': summary['key_points'],
-                    'entities': summary['entities'],
-                    'caller_count': summary['caller_count']
+                    'entities': entities,
+                    'caller_count': caller_count
                 })
                 
-                programs_data[program_name]['callers'] += summary['caller_count']
-                programs_data[program_name]['entities'].update(summary['entities'])
+                prog_data['callers'] += caller_count
+                prog_data['entities'].update(entities)
                 
-                total_callers += summary['caller_count']
-                all_entities.update(summary['entities'])
+                total_callers += caller_count
+                all_entities.update(entities)
         
         if not programs_data:
             return None
@@ -393,23 +422,28 @@ Maintain objectivity and focus on factual content relevant to government decisio
                               total_callers: int, entities: List[str]) -> Optional[str]:
         """Generate combined daily digest using GPT for all programs."""
         
-        # Prepare content grouped by program
-        programs_content = ""
+        # Prepare content grouped by program (collect parts, join once)
+        content_parts = []
         total_blocks = 0
         
         for program_name, prog_data in programs_data.items():
-            programs_content += f"\n\n{'='*60}\n"
-            programs_content += f"PROGRAM: {program_name}\n"
-            programs_content += f"Callers: {prog_data['callers']}\n"
-            programs_content += f"Blocks: {len(prog_data['blocks'])}\n"
-            programs_content += f"{'='*60}\n"
+            content_parts.append(
+                f"\n\n{'='*60}\n"
+                f"PROGRAM: {program_name}\n"
+                f"Callers: {prog_data['callers']}\n"
+                f"Blocks: {len(prog_data['blocks'])}\n"
+                f"{'='*60}\n"
+            )
             
             for block_summary in prog_data['blocks']:
-                programs_content += f"\n--- Block {block_summary['block_code']} - {block_summary['block_name']} ---\n"
-                programs_content += f"Callers: {block_summary['caller_count']}\n"
-                programs_content += block_summary['summary']
+                content_parts.append(
+                    f"\n--- Block {block_summary['block_code']} - {block_summary['block_name']} ---\n"
+                    f"Callers: {block_summary['caller_count']}\n"
+                )
+                content_parts.append(block_summary['summary'])
                 total_blocks += 1
         
+        programs_content = ''.join(content_parts)
         programs_list = ', '.join(programs_data.keys())
         
         prompt = f"""
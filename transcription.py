@@ -5,7 +5,9 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, List
 import json
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
 from database import db
 
@@ -241,16 +243,20 @@ class AudioTranscriber:
             logger.error("Failed to split audio file")
             return None
         
-        # Transcribe each chunk
+        # Transcribe chunks concurrently - each Whisper call is network-bound.
+        # Call the base transcription method directly to avoid recursion.
+        max_workers = min(len(chunks), Config.TRANSCRIPTION_CONCURRENCY)
+        logger.info(f"Transcribing {len(chunks)} chunks with up to {max_workers} concurrent requests")
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = list(executor.map(self._transcribe_audio_direct, chunks))
+        
+        # Merge results in chunk order
         all_segments = []
-        full_text = ""
+        text_parts = []
         total_duration = 0
         
-        for i, chunk_path in enumerate(chunks):
-            logger.info(f"Transcribing chunk {i+1}/{len(chunks)}: {chunk_path}")
-            
-            # Call the base transcription method directly to avoid recursion
-            chunk_data = self._transcribe_audio_direct(chunk_path)
+        for i, (chunk_path, chunk_data) in enumerate(zip(chunks, chunk_results)):
             if chunk_data:
                 # Adjust timestamps for chunk offset
                 chunk_offset = i * chunk_duration
@@ -260,7 +266,7 @@ class AudioTranscriber:
                     segment['end'] += chunk_offset
                     all_segments.append(segment)
                 
-                full_text += " " + chunk_data['text']
+                text_parts.append(chunk_data['text'])
                 total_duration += chunk_data['duration']
             
             # Clean up chunk file
@@ -268,7 +274,7 @@ class AudioTranscriber:
         
         if all_segments:
             return {
-                'text': full_text.strip(),
+                'text': ' '.join(text_parts).strip(),
                 'language': 'en',
                 'duration': total_duration,
                 'segments': all_segments,
@@ -281,8 +287,6 @@ class AudioTranscriber:
     def _split_audio_file(self, audio_path: Path, chunk_duration: int) -> List[Path]:
         """Split audio file into chunks using ffmpeg."""
         
-        import subprocess
-        
         chunks = []
         chunk_index = 0
         
@@ -306,7 +310,15 @@ class AudioTranscriber:
             
             result = subprocess.run(cmd, capture_output=True)
             
-            if result.returncode == 0 and chunk_path.exists() and chunk_path.stat().st_size > 1000:
+            # A single stat covers both "was it written" and "is it non-trivial"
+            chunk_size = 0
+            if result.returncode == 0:
+                try:
+                    chunk_size = chunk_path.stat().st_size
+                except FileNotFoundError:
+                    pass
+            
+            if chunk_size > 1000:
                 chunks.append(chunk_path)
                 chunk_index += 1
             else:
@@ -338,9 +350,8 @@ class AudioTranscriber:
     def _count_callers(self, segments: List[Dict]) -> int:
         """Count unique callers in the transcript."""
         
-        caller_segments = [s for s in segments if s.get('speaker') == 'Caller']
-        
-        # Simple heuristic: count speaker transitions to "Caller"
+        # Simple heuristic: count speaker transitions to "Caller". Any caller
+        # segment starts at least one transition, so no separate scan is needed.
         caller_count = 0
         prev_speaker = None
         
@@ -350,7 +361,7 @@ class AudioTranscriber:
                 caller_count += 1
             prev_speaker = current_speaker
         
-        return max(caller_count, 1) if caller_segments else 0
+        return caller_count
     
     def _extract_quotes(self, segments: List[Dict], max_quotes: int = 5) -> List[Dict]:
         """Extract notable quotes from segments."""
@@ -359,10 +370,12 @@ class AudioTranscriber:
         
         for segment in segments:
             text = segment['text'].strip()
+            if not 20 < len(text) < 150:
+                continue
+            text_lower = text.lower()
             
             # Look for interesting quotes (questions, strong statements, etc.)
-            if (len(text) > 20 and len(text) < 150 and 
-                any(indicator in text.lower() for indicator in [
+            if (any(indicator in text_lower for indicator in [
                     '?', 'important', 'problem', 'issue', 'concern',
                     'government', 'minister', 'policy', 'community'
                 ])):
@@ -10,6 +10,9 @@ from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict
 import json
 import logging
+import re
+import threading
+import time
 from pathlib import Path
 
 from config import Config
@@ -36,7 +39,9 @@ def setup_directories():
 
 setup_directories()
 
-# Create the single FastAPI app instance here
+# Create the single FastAPI app instance here.
+# Routes that touch SQLite or the network are plain `def` so FastAPI runs them
+# in its worker threadpool instead of blocking the event loop.
 app = FastAPI(title="Radio Synopsis Dashboard", version="1.0.0")
 
 # Set up templates directory
@@ -45,6 +50,10 @@ templates_dir.mkdir(exist_ok=True)
 
 templates = Jinja2Templates(directory="templates")
 
+# Program list and display names are static config; build them once
+AVAILABLE_PROGRAMS = list(Config.PROGRAMS.keys())
+PROGRAM_NAMES = {key: Config.PROGRAMS[key]['name'] for key in AVAILABLE_PROGRAMS}
+
 # Create static files directory for CSS/JS
 static_dir = Path("static")
 static_dir.mkdir(exist_ok=True)
@@ -52,37 +61,45 @@ static_dir.mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request, date_param: Optional[str] = None, program: Optional[str] = None, 
-                   message: Optional[str] = None, error: Optional[str] = None):
+def dashboard(request: Request, date_param: Optional[str] = None, program: Optional[str] = None, 
+             message: Optional[str] = None, error: Optional[str] = None):
     """Main dashboard showing today's or specified date's results."""
     
+    # Read the clock once per request
+    today = date.today()
+    
     # Parse date parameter or use today
     if date_param:
         try:
             view_date = datetime.strptime(date_param, '%Y-%m-%d').date()
         except ValueError:
-            view_date = date.today()
+            view_date = today
     else:
-        view_date = date.today()
+        view_date = today
     
     # Get show and blocks data (optionally filtered by program)
     shows = db.get_shows_by_date(view_date)
     blocks = db.get_blocks_by_date(view_date, program)
     
-    # Get all available programs
-    available_programs = list(Config.PROGRAMS.keys())
-    program_names = {key: Config.PROGRAMS[key]['name'] for key in available_programs}
-    
     # Get all blocks configuration
     all_blocks = Config.get_all_blocks()
     
-    # Get summaries for each block
+    # Get summaries for all blocks in one query
+    summaries = db.get_summaries_by_block_ids([b['id'] for b in blocks])
     block_data = []
+    completed_blocks = 0
+    total_callers = 0
     for block in blocks:
-        summary = db.get_summary(block['id'])
+        summary = summaries.get(block['id'])
         block_code = block['block_code']
         block_config = all_blocks.get(block_code, {})
         
+        # Accumulate statistics in the same pass
+        if block['status'] == 'completed':
+            completed_blocks += 1
+        if summary:
+            total_callers += summary['caller_count']
+        
         block_info = {
             **block,
             'summary': summary,
@@ -101,16 +118,9 @@ async def dashboard(request: Request, date_param: Optional[str] = None, program:
     
     # Calculate statistics
     total_blocks = len(blocks)
-    completed_blocks = len([b for b in blocks if b['status'] == 'completed'])
-    total_callers = sum(b['summary']['caller_count'] if b['summary'] else 0 for b in block_data)
     
     # Get recent dates for navigation
-    recent_dates = []
-    for i in range(7):
-        check_date = date.today() - timedelta(days=i)
-        recent_shows = db.get_blocks_by_date(check_date)
-        if recent_shows:
-            recent_dates.append(check_date)
+    recent_dates = db.get_dates_with_blocks(today - timedelta(days=6), today)
     
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
@@ -123,27 +133,27 @@ async def dashboard(request: Request, date_param: Optional[str] = None, program:
             "total_blocks": total_blocks,
             "completed_blocks": completed_blocks,
             "total_callers": total_callers,
-            "completion_rate": round(completed_blocks / total_blocks * 100) if total_blocks > 0 else 0
+            "completion_rate": (completed_blocks * 100 + total_blocks // 2) // total_blocks if total_blocks > 0 else 0
         },
         "recent_dates": recent_dates,
-        "is_today": view_date == date.today(),
+        "is_today": view_date == today,
         "message": message,
         "error": error,
         "config": Config,
-        "programs": available_programs,
-        "program_names": program_names,
+        "programs": AVAILABLE_PROGRAMS,
+        "program_names": PROGRAM_NAMES,
         "selected_program": program
     })
 
 @app.get("/block/{block_id}", response_class=HTMLResponse)
-async def block_detail(request: Request, block_id: int):
+def block_detail(request: Request, block_id: int):
     """Detailed view of a specific block."""
     
-    block = db.get_block(block_id)
+    block = db.get_block_with_summary(block_id)
     if not block:
         raise HTTPException(status_code=404, detail="Block not found")
     
-    summary = db.get_summary(block_id)
+    summary = block['summary']
     
     # Load transcript if available
     transcript_data = None
@@ -151,7 +161,7 @@ async def block_detail(request: Request, block_id: int):
         try:
             with open(block['transcript_file_path'], 'r', encoding='utf-8') as f:
                 transcript_data = json.load(f)
-        except:
+        except (OSError, ValueError):
             pass
     
     # Get block configuration
@@ -175,7 +185,7 @@ async def block_detail(request: Request, block_id: int):
     })
 
 @app.get("/archive", response_class=HTMLResponse)
-async def archive(request: Request):
+def archive(request: Request):
     """Archive view showing all available dates."""
     
     # Get all unique dates with shows
@@ -198,7 +208,7 @@ async def archive(request: Request):
     })
 
 @app.get("/api/status")
-async def api_status():
+def api_status():
     """API endpoint for current system status."""
     
     today = date.today()
@@ -214,7 +224,7 @@ async def api_status():
         with db.get_connection() as conn:
             conn.execute("SELECT 1").fetchone()
         db_status = "healthy"
-    except:
+    except Exception:
         db_status = "unhealthy"
     
     return {
@@ -237,16 +247,22 @@ async def get_public_config():
     return config_data
 
 @app.post("/api/manual-record")
-async def manual_record(block_code: str = Form(...)):
+def manual_record(block_code: str = Form(...)):
     """Manually trigger recording for a block."""
     
     if block_code not in Config.BLOCKS:
         raise HTTPException(status_code=400, detail="Invalid block code")
     
     try:
-        success = scheduler.run_manual_recording(block_code)
+        # Recording lasts the whole block, so run it in a background thread
+        def record_thread():
+            if not scheduler.run_manual_recording(block_code):
+                logger.error(f"Manual recording failed for Block {block_code}")
+        
+        threading.Thread(target=record_thread, daemon=True).start()
+        
         # Redirect back to dashboard with a message
-        return RedirectResponse(url=f"/?message=Recording {'started' if success else 'failed'} for Block {block_code}", status_code=303)
+        return RedirectResponse(url=f"/?message=Recording started for Block {block_code}", status_code=303)
     except Exception as e:
         return RedirectResponse(url=f"/?error=Failed to start recording: {str(e)}", status_code=303)
 
@@ -265,7 +281,6 @@ async def manual_record_duration(
     
     try:
         from audio_recorder import recorder
-        import threading
         
         # Run recording in background thread
         def record_thread():
@@ -290,21 +305,27 @@ async def manual_record_duration(
         return RedirectResponse(url=f"/?error=Failed to start duration recording: {str(e)}", status_code=303)
 
 @app.post("/api/manual-process")
-async def manual_process(block_code: str = Form(...)):
+def manual_process(block_code: str = Form(...)):
     """Manually trigger processing for a block."""
     
     if block_code not in Config.BLOCKS:
         raise HTTPException(status_code=400, detail="Invalid block code")
     
     try:
-        success = scheduler.run_manual_processing(block_code)
+        # Transcription and summarization take minutes, so run them in a background thread
+        def process_thread():
+            if not scheduler.run_manual_processing(block_code):
+                logger.error(f"Manual processing failed for Block {block_code}")
+        
+        threading.Thread(target=process_thread, daemon=True).start()
+        
         # Redirect back to dashboard with a message
-        return RedirectResponse(url=f"/?message=Processing {'started' if success else 'failed'} for Block {block_code}", status_code=303)
+        return RedirectResponse(url=f"/?message=Processing started for Block {block_code}", status_code=303)
     except Exception as e:
         return RedirectResponse(url=f"/?error=Failed to start processing: {str(e)}", status_code=303)
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint."""
     
     try:
@@ -313,7 +334,7 @@ async def health_check():
             conn.execute("SELECT 1").fetchone()
         
         db_status = "healthy"
-    except:
+    except Exception:
         db_status = "unhealthy"
     
     return {
@@ -324,7 +345,7 @@ async def health_check():
     }
 
 @app.get("/debug/blocks")
-async def debug_blocks():
+def debug_blocks():
     """Debug endpoint to check block status - disabled by default for security."""
     if not Config.ENABLE_DEBUG_ENDPOINTS:
         raise HTTPException(status_code=404, detail="Debug endpoints are disabled")
@@ -352,7 +373,7 @@ async def debug_blocks():
         return {"error": str(e)}
 
 @app.post("/debug/reset-block-status")
-async def reset_block_status(block_code: str = Form(...)):
+def reset_block_status(block_code: str = Form(...)):
     """Reset block status to 'recorded' for debugging - disabled by default for security."""
     if not Config.ENABLE_DEBUG_ENDPOINTS:
         raise HTTPException(status_code=404, detail="Debug endpoints are disabled")
@@ -369,43 +390,57 @@ async def reset_block_status(block_code: str = Form(...)):
     except Exception as e:
         return {"error": str(e)}
 
+# Station settings endpoint and browser-like headers shared by the debug endpoints
+_STATION_SETTINGS_URL = "https://radio.securenetsystems.net/cirrusencore/embed/stationSettings.cfm?stationCallSign=VOB929"
+_STATION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Referer': 'https://starcomnetwork.net/'
+}
+_STREAM_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'audio/*,*/*;q=0.9',
+    'Accept-Encoding': 'identity',
+    'Connection': 'keep-alive',
+    'Referer': 'https://starcomnetwork.net/radio-stations/stream-vob-92-9-fm/'
+}
+
+# Candidate session ID patterns in the station settings response; the first is
+# the one the stream test relies on
+_SESSION_ID_PATTERNS = [
+    re.compile(r"playSessionID['\"]='([^'\"]+)"),
+    re.compile(r"playSessionID['\"]:\s*['\"]([^'\"]+)"),
+    re.compile(r"playSessionID['\"][=:]\s*['\"]([^'\"]+)"),
+    re.compile(r"sessionID['\"]='([^'\"]+)"),
+    re.compile(r"streamSRC['\"]='[^'\"]*playSessionID=([^'\"&]+)")
+]
+
+def _fetch_station_settings():
+    """Open a browser-like session and fetch the station settings page."""
+    import requests
+    
+    session = requests.Session()
+    session.headers.update(_STATION_HEADERS)
+    settings_response = session.get(_STATION_SETTINGS_URL, timeout=10)
+    settings_response.raise_for_status()
+    return session, settings_response
+
 @app.get("/debug/station-settings")
-async def debug_station_settings():
+def debug_station_settings():
     """Debug endpoint to check the station settings response - disabled by default for security."""
     if not Config.ENABLE_DEBUG_ENDPOINTS:
         raise HTTPException(status_code=404, detail="Debug endpoints are disabled")
     try:
-        import requests
-        import re
-        
-        # Get station settings response
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Referer': 'https://starcomnetwork.net/'
-        })
-        
         logger.info("Debug: Fetching station settings...")
-        settings_url = "https://radio.securenetsystems.net/cirrusencore/embed/stationSettings.cfm?stationCallSign=VOB929"
-        settings_response = session.get(settings_url, timeout=10)
-        settings_response.raise_for_status()
+        _, settings_response = _fetch_station_settings()
         
         # Try different regex patterns
-        patterns = [
-            r"playSessionID['\"]='([^'\"]+)",
-            r"playSessionID['\"]:\s*['\"]([^'\"]+)",
-            r"playSessionID['\"][=:]\s*['\"]([^'\"]+)",
-            r"sessionID['\"]='([^'\"]+)",
-            r"streamSRC['\"]='[^'\"]*playSessionID=([^'\"&]+)"
-        ]
-        
         matches = {}
-        for i, pattern in enumerate(patterns):
-            match = re.search(pattern, settings_response.text)
+        for i, pattern in enumerate(_SESSION_ID_PATTERNS):
+            match = pattern.search(settings_response.text)
             if match:
                 matches[f"pattern_{i+1}"] = match.group(1)
         
@@ -414,7 +449,7 @@ async def debug_station_settings():
             "response_length": len(settings_response.text),
             "response_preview": settings_response.text[:1000],
             "response_full": settings_response.text,
-            "patterns_tried": len(patterns),
+            "patterns_tried": len(_SESSION_ID_PATTERNS),
             "matches_found": matches,
             "http_status": settings_response.status_code,
             "headers": dict(settings_response.headers)
@@ -424,33 +459,17 @@ async def debug_station_settings():
         return {"error": str(e)}
 
 @app.get("/debug/stream-test")
-async def debug_stream_test():
+def debug_stream_test():
     """Debug endpoint to test stream connectivity - disabled by default for security."""
     if not Config.ENABLE_DEBUG_ENDPOINTS:
         raise HTTPException(status_code=404, detail="Debug endpoints are disabled")
     try:
-        import requests
-        import re
-        import time
-        
         # Get fresh session ID from station settings
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Referer': 'https://starcomnetwork.net/'
-        })
-        
         logger.info("Debug: Fetching fresh session ID from station settings...")
-        settings_url = "https://radio.securenetsystems.net/cirrusencore/embed/stationSettings.cfm?stationCallSign=VOB929"
-        settings_response = session.get(settings_url, timeout=10)
-        settings_response.raise_for_status()
+        session, settings_response = _fetch_station_settings()
         
         # Extract session ID from settings
-        session_match = re.search(r"playSessionID['\"]='([^'\"]+)", settings_response.text)
+        session_match = _SESSION_ID_PATTERNS[0].search(settings_response.text)
         if not session_match:
             return {"error": "Could not extract session ID from station settings", "response_text": settings_response.text[:500]}
         
@@ -458,13 +477,7 @@ async def debug_stream_test():
         stream_url = f"https://ice66.securenetsystems.net/VOB929?playSessionID={session_id}"
         
         # Update headers for stream request
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'audio/*,*/*;q=0.9',
-            'Accept-Encoding': 'identity',
-            'Connection': 'keep-alive',
-            'Referer': 'https://starcomnetwork.net/radio-stations/stream-vob-92-9-fm/'
-        })
+        session.headers.update(_STREAM_HEADERS)
         
         # Test stream connectivity
         start_time = time.time()
@@ -497,351 +510,6 @@ async def debug_stream_test():
     except Exception as e:
         return {"error": str(e)}
 
-# Create HTML templates
-def create_templates():
-    """Create HTML template files."""
-    
-    # Main dashboard template
-    dashboard_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Radio Synopsis Dashboard</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <style>
-        .status-badge {
-            font-size: 0.75em;
-        }
-        .block-card {
-            margin-bottom: 1rem;
-        }
-        .quote-text {
-            font-style: italic;
-            border-left: 3px solid #007bff;
-            padding-left: 10px;
-        }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
-        <div class="container">
-            <a class="navbar-brand" href="/">Radio Synopsis Dashboard</a>
-            <div class="navbar-nav ms-auto">
-                <a class="nav-link" href="/archive">Archive</a>
-            </div>
-        </div>
-    </nav>
-
-    <div class="container mt-4">
-        <div class="row">
-            <div class="col-md-8">
-                <div class="d-flex justify-content-between align-items-center mb-4">
-                    <h2>{{ view_date.strftime('%B %d, %Y') }}</h2>
-                    {% if is_today %}
-                        <span class="badge bg-success">Today</span>
-                    {% endif %}
-                </div>
-
-                <!-- Date Navigation -->
-                <div class="mb-4">
-                    <div class="btn-group" role="group">
-                        {% for recent_date in recent_dates %}
-                            <a href="/?date_param={{ recent_date }}" 
-                               class="btn btn-sm {% if recent_date == view_date %}btn-primary{% else %}btn-outline-primary{% endif %}">
-                                {{ recent_date.strftime('%m/%d') }}
-                            </a>
-                        {% endfor %}
-                    </div>
-                </div>
-
-                <!-- Blocks -->
-                {% for block in blocks %}
-                <div class="card block-card">
-                    <div class="card-header d-flex justify-content-between align-items-center">
-                        <h5 class="mb-0">Block {{ block.block_code }} - {{ block.block_name }}</h5>
-                        <span class="badge status-badge 
-                            {% if block.status == 'completed' %}bg-success
-                            {% elif block.status == 'failed' %}bg-danger
-                            {% elif block.status in ['recording', 'transcribing', 'summarizing'] %}bg-warning
-                            {% else %}bg-secondary{% endif %}">
-                            {{ block.status.title() }}
-                        </span>
-                    </div>
-                    <div class="card-body">
-                        {% if block.summary %}
-                            <p class="card-text">{{ block.summary.summary_text[:300] }}{% if block.summary.summary_text|length > 300 %}...{% endif %}</p>
-                            
-                            {% if block.summary.key_points %}
-                                <h6>Key Points:</h6>
-                                <ul>
-                                    {% for point in block.summary.key_points[:3] %}
-                                        <li>{{ point }}</li>
-                                    {% endfor %}
-                                </ul>
-                            {% endif %}
-                            
-                            <div class="d-flex justify-content-between">
-                                <small class="text-muted">
-                                    {{ block.duration_display }} | {{ block.summary.caller_count }} callers
-                                </small>
-                                <a href="/block/{{ block.id }}" class="btn btn-sm btn-outline-primary">View Details</a>
-                            </div>
-                        {% else %}
-                            <p class="text-muted">No summary available yet.</p>
-                            {% if is_today and block.status == 'recorded' %}
-                                <form method="post" action="/api/manual-process" class="d-inline">
-                                    <input type="hidden" name="block_code" value="{{ block.block_code }}">
-                                    <button type="submit" class="btn btn-sm btn-primary">Process Now</button>
-                                </form>
-                            {% endif %}
-                        {% endif %}
-                    </div>
-                </div>
-                {% endfor %}
-
-                <!-- Daily Digest -->
-                {% if digest %}
-                <div class="card mt-4">
-                    <div class="card-header">
-                        <h5 class="mb-0">Daily Digest</h5>
-                    </div>
-                    <div class="card-body">
-                        <pre>{{ digest.digest_text }}</pre>
-                    </div>
-                </div>
-                {% endif %}
-            </div>
-
-            <div class="col-md-4">
-                <!-- Statistics -->
-                <div class="card mb-4">
-                    <div class="card-header">
-                        <h6 class="mb-0">Statistics</h6>
-                    </div>
-                    <div class="card-body">
-                        <div class="row text-center">
-                            <div class="col-6">
-                                <div class="h4">{{ stats.completed_blocks }}/{{ stats.total_blocks }}</div>
-                                <small class="text-muted">Blocks Completed</small>
-                            </div>
-                            <div class="col-6">
-                                <div class="h4">{{ stats.total_callers }}</div>
-                                <small class="text-muted">Total Callers</small>
-                            </div>
-                        </div>
-                        <div class="progress mt-3">
-                            <div class="progress-bar" style="width: {{ stats.completion_rate }}%"></div>
-                        </div>
-                        <small class="text-muted">{{ stats.completion_rate }}% Complete</small>
-                    </div>
-                </div>
-
-                <!-- Manual Controls -->
-                {% if is_today %}
-                <div class="card">
-                    <div class="card-header">
-                        <h6 class="mb-0">Manual Controls</h6>
-                    </div>
-                    <div class="card-body">
-                        <div class="d-grid gap-3">
-                            {% for code in ['A', 'B', 'C', 'D'] %}
-                                <div class="border rounded p-3">
-                                    <h6 class="mb-2">Block {{ code }} - {{ config.BLOCKS[code].name }}</h6>
-                                    
-                                    <!-- Original scheduled recording -->
-                                    <div class="btn-group mb-2" role="group">
-                                        <form method="post" action="/api/manual-record" class="d-inline">
-                                            <input type="hidden" name="block_code" value="{{ code }}">
-                                            <button type="submit" class="btn btn-sm btn-outline-danger">Record (Scheduled)</button>
-                                        </form>
-                                        <form method="post" action="/api/manual-process" class="d-inline">
-                                            <input type="hidden" name="block_code" value="{{ code }}">
-                                            <button type="submit" class="btn btn-sm btn-outline-primary">Process</button>
-                                        </form>
-                                    </div>
-                                    
-                                    <!-- Duration-based recording -->
-                                    <form method="post" action="/api/manual-record-duration" class="d-flex gap-2 align-items-center">
-                                        <input type="hidden" name="block_code" value="{{ code }}">
-                                        <label class="form-label mb-0 small">Duration:</label>
-                                        <select name="duration_minutes" class="form-select form-select-sm" style="width: auto;">
-                                            <option value="1">1 min</option>
-                                            <option value="2">2 min</option>
-                                            <option value="5" selected>5 min</option>
-                                            <option value="10">10 min</option>
-                                            <option value="15">15 min</option>
-                                            <option value="30">30 min</option>
-                                        </select>
-                                        <button type="submit" class="btn btn-sm btn-success">Record Now</button>
-                                    </form>
-                                </div>
-                            {% endfor %}
-                        </div>
-                    </div>
-                </div>
-                {% endif %}
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-
-    # Block detail template
-    block_detail_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Block {{ block.block_code }} Details</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
-        <div class="container">
-            <a class="navbar-brand" href="/">Radio Synopsis Dashboard</a>
-            <div class="navbar-nav ms-auto">
-                <a class="nav-link" href="/">Dashboard</a>
-                <a class="nav-link" href="/archive">Archive</a>
-            </div>
-        </div>
-    </nav>
-
-    <div class="container mt-4">
-        <h2>Block {{ block.block_code }} - {{ block.block_name }}</h2>
-        
-        {% if block.summary %}
-            <div class="card mb-4">
-                <div class="card-header">
-                    <h5>Summary</h5>
-                </div>
-                <div class="card-body">
-                    <p>{{ block.summary.summary_text }}</p>
-                    
-                    {% if block.summary.key_points %}
-                        <h6>Key Points:</h6>
-                        <ul>
-                            {% for point in block.summary.key_points %}
-                                <li>{{ point }}</li>
-                            {% endfor %}
-                        </ul>
-                    {% endif %}
-                    
-                    {% if block.summary.quotes %}
-                        <h6>Notable Quotes:</h6>
-                        {% for quote in block.summary.quotes %}
-                            <blockquote class="blockquote">
-                                <p>"{{ quote.text }}"</p>
-                                <footer class="blockquote-footer">{{ quote.speaker }} at {{ quote.timestamp }}</footer>
-                            </blockquote>
-                        {% endfor %}
-                    {% endif %}
-                    
-                    {% if block.summary.entities %}
-                        <h6>Entities Mentioned:</h6>
-                        <div>
-                            {% for entity in block.summary.entities %}
-                                <span class="badge bg-secondary me-1">{{ entity }}</span>
-                            {% endfor %}
-                        </div>
-                    {% endif %}
-                </div>
-            </div>
-        {% endif %}
-        
-        {% if block.transcript %}
-            <div class="card">
-                <div class="card-header">
-                    <h5>Transcript</h5>
-                </div>
-                <div class="card-body">
-                    {% if block.transcript.segments %}
-                        {% for segment in block.transcript.segments %}
-                            <div class="mb-2">
-                                <small class="text-muted">[{{ "%.0f" | format(segment.start) }}s] {{ segment.speaker }}:</small>
-                                <p>{{ segment.text }}</p>
-                            </div>
-                        {% endfor %}
-                    {% else %}
-                        <p>{{ block.transcript.text }}</p>
-                    {% endif %}
-                </div>
-            </div>
-        {% endif %}
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-
-    # Archive template
-    archive_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Archive - Radio Synopsis</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-</head>
-<body>
-    <nav class="navbar navbar-expand-lg navbar-dark bg-primary">
-        <div class="container">
-            <a class="navbar-brand" href="/">Radio Synopsis Dashboard</a>
-            <div class="navbar-nav ms-auto">
-                <a class="nav-link" href="/">Dashboard</a>
-            </div>
-        </div>
-    </nav>
-
-    <div class="container mt-4">
-        <h2>Archive</h2>
-        
-        <div class="table-responsive">
-            <table class="table table-striped">
-                <thead>
-                    <tr>
-                        <th>Date</th>
-                        <th>Show Title</th>
-                        <th>Blocks</th>
-                        <th>Completion</th>
-                        <th>Actions</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for show in archive_data %}
-                        <tr>
-                            <td>{{ show.show_date }}</td>
-                            <td>{{ show.title }}</td>
-                            <td>{{ show.total_blocks }}</td>
-                            <td>
-                                <div class="progress">
-                                    <div class="progress-bar" style="width: {{ (show.completed_blocks / show.total_blocks * 100) if show.total_blocks > 0 else 0 }}%"></div>
-                                </div>
-                                {{ show.completed_blocks }}/{{ show.total_blocks }}
-                            </td>
-                            <td>
-                                <a href="/?date_param={{ show.show_date }}" class="btn btn-sm btn-primary">View</a>
-                            </td>
-                        </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>
-"""
-
-
 
 def start_web_server():
     """Start the web server for local execution."""